@@ -1,53 +1,142 @@
+import math
+import re
 import serial
 import tkinter as tk
 from tkinter import ttk
-import datetime
-import threading
-from collections import deque
+
+try:
+    # Optional C-accelerated replacement for float(), used for the six conversions per frame.
+    from fastnumbers import fast_float as _to_float
+except ImportError:
+    _to_float = float
+
+# A single IMU frame: "S" followed by six '/'-separated numbers and an "E", e.g. b"S0.05/0.11/1.01/-1.38/0.44/0.31E".
+# The number pattern only accepts valid decimal floats, so converting the captured groups cannot fail.
+_NUMBER = rb'([-+]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?)'
+_FRAME_RE = re.compile(rb'^S' + rb'/'.join([_NUMBER] * 6) + rb'E\s*$')
 
 def parse_imu_data(data):
     """
-    Parses the IMU data string and returns the acceleration and gyro values.
+    Parses the IMU data line and returns the acceleration and gyro values.
 
     Args:
-        data (str): The IMU data string in the format "S0.05/0.11/1.01/-1.38/0.44/0.31E".
+        data (bytes): The raw IMU data line in the format b"S0.05/0.11/1.01/-1.38/0.44/0.31E".
+                      Trailing whitespace (such as the "\\r" sent by println) is ignored.
 
     Returns:
         tuple: A tuple containing (acc_x, acc_y, acc_z, gyro_x, gyro_y, gyro_z).
-               Returns None if the data string is invalid.
+               Returns None if the data line is invalid.
     """
-    if not data.startswith("S") or not data.endswith("E"):
-        return None  # Invalid data format
+    match = _FRAME_RE.match(data)
+    if not match:
+        return None  # Invalid data format, incorrect number of values or malformed number
 
-    try:
-        values = data[1:-1].split("/")  # Remove 'S' and 'E', then split by '/'
-        if len(values) != 6:
-            return None  # Incorrect number of values
+    # Both float() and fast_float() accept the matched bytes directly, no need to decode them first.
+    return tuple(map(_to_float, match.groups()))
 
-        # Convert the string values to floats.
-        acc_x, acc_y, acc_z, gyro_x, gyro_y, gyro_z = map(float, values)
-        return acc_x, acc_y, acc_z, gyro_x, gyro_y, gyro_z
-    except ValueError:
-        return None  # Error converting values to float
+DEFAULT_WINDOW_SIZE = 10  # Number of data points averaged by the filters (equivalent window for the EMA)
 
-def moving_average_filter(data_queue, new_value, window_size=10):
+class MovingAverageFilter:
     """
-    Applies a moving average filter to the data.
+    Moving average filter for several data streams at once (e.g. the six IMU channels).
+    The samples are kept in a fixed-size ring buffer along with a running sum per channel,
+    so each update costs O(channels) regardless of the window size.
+    """
+    def __init__(self, channels, window_size=DEFAULT_WINDOW_SIZE):
+        """
+        Args:
+            channels (int): The number of data streams filtered together.
+            window_size (int): The number of data points to average.
+        """
+        self.window_size = window_size
+        self.ring = [(0.0,) * channels] * window_size  # The last window_size samples, one tuple per sample
+        self.index = 0  # Position in ring where the next sample goes
+        self.count = 0  # Number of samples in the ring, up to window_size
+        self.totals = (0.0,) * channels  # Per-channel sum of the samples in the ring
+        self.description = f"Moving Average, Window Size={window_size}"  # Shown in the filtered data heading
+
+    def update(self, new_values):
+        """
+        Adds a new sample to the filter.
+
+        Args:
+            new_values (tuple): The new data point of each channel.
+
+        Returns:
+            tuple: The filtered value of each channel.
+        """
+        old_values = self.ring[self.index]  # All zeros until the ring has filled up
+        self.ring[self.index] = new_values
+        self.index = (self.index + 1) % self.window_size
+        if self.count < self.window_size:
+            self.count += 1
+        self.totals = tuple(total + new - old for total, new, old in zip(self.totals, new_values, old_values))
+        count = self.count
+        return tuple(total / count for total in self.totals)
+
+class ExponentialMovingAverageFilter:
+    """
+    Exponential moving average (single-pole IIR) filter for several data streams at once.
+    Each update is one multiply and one add per channel, with no sample history to keep.
+    Uses the smoothing factor 2 / (window_size + 1), which gives the same average age of the data
+    as a moving average over window_size points, but responds less sharply to the oldest samples.
+    """
+    def __init__(self, channels, window_size=DEFAULT_WINDOW_SIZE):
+        """
+        Args:
+            channels (int): The number of data streams filtered together.
+            window_size (int): The equivalent moving average window, used to derive the smoothing factor.
+        """
+        self.alpha = 2 / (window_size + 1)
+        self.values = (0.0,) * channels  # Filtered value of each channel
+        self.seeded = False  # Whether values has been set from a first sample yet
+        self.description = f"EMA, Smoothing Factor={self.alpha:.2f}"  # Shown in the filtered data heading
+
+    def update(self, new_values):
+        """
+        Adds a new sample to the filter.
+
+        Args:
+            new_values (tuple): The new data point of each channel.
+
+        Returns:
+            tuple: The filtered value of each channel.
+        """
+        if not self.seeded:
+            self.values = tuple(new_values)  # Start from the first sample rather than ramping up from zero
+            self.seeded = True
+        else:
+            alpha = self.alpha
+            self.values = tuple(old + alpha * (new - old) for old, new in zip(self.values, new_values))
+        return self.values
+
+def process_frame(data, imu_filter):
+    """
+    Parses an IMU data line and runs its values through the filter, in a single call per line.
 
     Args:
-        data_queue (deque): A deque containing the previous data points.
-        new_value (float): The new data point to add to the filter.
-        window_size (int): The number of data points to average.
+        data (bytes): The raw IMU data line, as accepted by parse_imu_data().
+        imu_filter (MovingAverageFilter or ExponentialMovingAverageFilter): The six-channel filter to update.
 
     Returns:
-        float: The filtered data value.
+        tuple: The raw values followed by the filtered values
+               (acc_x, acc_y, acc_z, gyro_x, gyro_y, gyro_z,
+                acc_x_filtered, acc_y_filtered, acc_z_filtered, gyro_x_filtered, gyro_y_filtered, gyro_z_filtered).
+               Returns None if the data line is invalid or holds a non-finite value (e.g. "1e999"),
+               in which case the filter is left unchanged.
     """
-    data_queue.append(new_value)
-    if len(data_queue) > window_size:
-        data_queue.popleft()
-    return sum(data_queue) / len(data_queue)
+    imu_data = parse_imu_data(data)
+    if imu_data is None:
+        return None
+    if not all(map(math.isfinite, imu_data)):
+        return None  # An inf would turn the filter's running state into nan for good
+    return imu_data + imu_filter.update(imu_data)
 
 class IMUApp:
+    # Data labels of each section: (channel, label text, x, y offset from the first row), in frame order
+    VALUE_LAYOUT = (("acc_x", "Acc X:", 10, 0), ("acc_y", "Acc Y:", 10, 20), ("acc_z", "Acc Z:", 10, 40),
+                    ("gyro_x", "Gyro X:", 200, 0), ("gyro_y", "Gyro Y:", 200, 20), ("gyro_z", "Gyro Z:", 200, 40))
+
     def __init__(self, root):
         self.root = root
         self.root.title("Live IMU Data")
@@ -57,7 +146,20 @@ class IMUApp:
         self.ser = None
         self.port = 'COM4'  # You may need to change this
         self.baudrate = 115200
-        self.timeout = 1
+        self.timeout = 0  # Non-blocking reads: _poll() runs on the Tk main loop and must never wait for data
+        self.buffer_size = 1 << 16  # Driver input/output buffer size in bytes (Windows only)
+        self.poll_interval = 5  # ms between checks for new data on the serial port
+        self.reconnect_interval = 1000  # ms between attempts to reopen the serial port after an error
+        self._buf = bytearray()  # Bytes received but not yet split into lines
+
+        # --- Filter ---
+        self.use_ema_filter = True  # Set to False to use the windowed moving average instead
+        filter_class = ExponentialMovingAverageFilter if self.use_ema_filter else MovingAverageFilter
+        self.imu_filter = filter_class(channels=6)  # acc_x, acc_y, acc_z, gyro_x, gyro_y, gyro_z
+
+        # --- GUI Refresh ---
+        self.gui_update_interval = 33  # ms between GUI refreshes (~30 Hz)
+        self._latest = None  # Most recent (raw + filtered) values not yet shown, see _tick()
 
         # --- UI Elements ---
         # Connection Info Label
@@ -70,6 +172,7 @@ class IMUApp:
         self.status_label_text = ttk.Label(self.status_label_frame, text="Connection Status: ", font=("Arial", 10))
         self.status_label_text.pack(side="left")
         self.status_var = tk.StringVar()
+        self._last_status = None  # Last text written to status_var, see set_status()
         self.status_label = ttk.Label(self.status_label_frame, textvariable=self.status_var, font=("Arial", 10, "italic"))
         self.status_label.pack(side="left")
 
@@ -93,203 +196,183 @@ class IMUApp:
         self.raw_label = ttk.Label(root, text="Raw Data", font=("Arial", 10, "bold"))
         self.raw_label.place(x=10, y=95) # Adjusted y-position
 
-        self.acc_x_label_text = ttk.Label(root, text="Acc X:")
-        self.acc_x_label_text.place(x=10, y=115)
-        self.acc_x_var = tk.StringVar()
-        self.acc_x_label = ttk.Label(root, textvariable=self.acc_x_var)
-        self.acc_x_label.place(x=60, y=115)
-
-        self.acc_y_label_text = ttk.Label(root, text="Acc Y:")
-        self.acc_y_label_text.place(x=10, y=135)
-        self.acc_y_var = tk.StringVar()
-        self.acc_y_label = ttk.Label(root, textvariable=self.acc_y_var)
-        self.acc_y_label.place(x=60, y=135)
-
-        self.acc_z_label_text = ttk.Label(root, text="Acc Z:")
-        self.acc_z_label_text.place(x=10, y=155)
-        self.acc_z_var = tk.StringVar()
-        self.acc_z_label = ttk.Label(root, textvariable=self.acc_z_var)
-        self.acc_z_label.place(x=60, y=155)
-
-        self.gyro_x_label_text = ttk.Label(root, text="Gyro X:")
-        self.gyro_x_label_text.place(x=200, y=115)
-        self.gyro_x_var = tk.StringVar()
-        self.gyro_x_label = ttk.Label(root, textvariable=self.gyro_x_var)
-        self.gyro_x_label.place(x=250, y=115)
-
-        self.gyro_y_label_text = ttk.Label(root, text="Gyro Y:")
-        self.gyro_y_label_text.place(x=200, y=135)
-        self.gyro_y_var = tk.StringVar()
-        self.gyro_y_label = ttk.Label(root, textvariable=self.gyro_y_var)
-        self.gyro_y_label.place(x=250, y=135)
-
-        self.gyro_z_label_text = ttk.Label(root, text="Gyro Z:")  # Added Gyro Z label
-        self.gyro_z_label_text.place(x=200, y=155)
-        self.gyro_z_var = tk.StringVar()
-        self.gyro_z_label = ttk.Label(root, textvariable=self.gyro_z_var)
-        self.gyro_z_label.place(x=250, y=155)
+        # StringVars of the data labels, keyed by channel ("acc_x") or filtered channel ("acc_x_filtered")
+        self._vars = {}
+        for channel, text, x, y in self.VALUE_LAYOUT:
+            self._vars[channel] = self._make_value_label(text, x, 115 + y)
 
         # Labels for the FILTERED data  VERTICAL display
-        self.filtered_label = ttk.Label(root, text=f"Filtered Data (Moving Average, Window Size={moving_average_filter.__defaults__[0]})", font=("Arial", 10, "bold"))
+        self.filtered_label = ttk.Label(root, text=f"Filtered Data ({self.imu_filter.description})", font=("Arial", 10, "bold"))
         self.filtered_label.place(x=10, y=175) # Adjusted y-position
 
-        self.acc_x_filtered_label_text = ttk.Label(root, text="Acc X:")
-        self.acc_x_filtered_label_text.place(x=10, y=195)
-        self.acc_x_filtered_var = tk.StringVar()
-        self.acc_x_filtered_label = ttk.Label(root, textvariable=self.acc_x_filtered_var)
-        self.acc_x_filtered_label.place(x=60, y=195)
-
-        self.acc_y_filtered_label_text = ttk.Label(root, text="Acc Y:")
-        self.acc_y_filtered_label_text.place(x=10, y=215)
-        self.acc_y_filtered_var = tk.StringVar()
-        self.acc_y_filtered_label = ttk.Label(root, textvariable=self.acc_y_filtered_var)
-        self.acc_y_filtered_label.place(x=60, y=215)
-
-        self.acc_z_filtered_label_text = ttk.Label(root, text="Acc Z:")
-        self.acc_z_filtered_label_text.place(x=10, y=235)
-        self.acc_z_filtered_var = tk.StringVar()
-        self.acc_z_filtered_label = ttk.Label(root, textvariable=self.acc_z_filtered_var)
-        self.acc_z_filtered_label.place(x=60, y=235)
-
-        self.gyro_x_filtered_label_text = ttk.Label(root, text="Gyro X:")
-        self.gyro_x_filtered_label_text.place(x=200, y=195)
-        self.gyro_x_filtered_var = tk.StringVar()
-        self.gyro_x_filtered_label = ttk.Label(root, textvariable=self.gyro_x_filtered_var)
-        self.gyro_x_filtered_label.place(x=250, y=195)
-
-        self.gyro_y_filtered_label_text = ttk.Label(root, text="Gyro Y:")
-        self.gyro_y_filtered_label_text.place(x=200, y=215)
-        self.gyro_y_filtered_var = tk.StringVar()
-        self.gyro_y_filtered_label = ttk.Label(root, textvariable=self.gyro_y_filtered_var)
-        self.gyro_y_filtered_label.place(x=250, y=215)
-
-        self.gyro_z_filtered_label_text = ttk.Label(root, text="Gyro Z:") # Added Gyro Z label
-        self.gyro_z_filtered_text = ttk.Label(root, text="Gyro Z:")
-        self.gyro_z_filtered_text.place(x=200, y=235)
-        self.gyro_z_filtered_var = tk.StringVar()
-        self.gyro_z_filtered_label = ttk.Label(root, textvariable=self.gyro_z_filtered_var)
-        self.gyro_z_filtered_label.place(x=250, y=235)
+        for channel, text, x, y in self.VALUE_LAYOUT:
+            self._vars[f"{channel}_filtered"] = self._make_value_label(text, x, 195 + y)
 
         # --- Exit Button ---
         self.exit_button = ttk.Button(root, text="Exit", command=self.on_close)
         self.exit_button.place(x=150, y=300, relwidth=0.2)
 
-        # --- Initialize Data Variables ---
-        self.acc_x_var.set("0.00")
-        self.acc_y_var.set("0.00")
-        self.acc_z_var.set("0.00")
-        self.gyro_x_var.set("0.00")
-        self.gyro_y_var.set("0.00")
-        self.gyro_z_var.set("0.00")
-
-        self.acc_x_filtered_var.set("0.00")
-        self.acc_y_filtered_var.set("0.00")
-        self.acc_z_filtered_var.set("0.00")
-        self.gyro_x_filtered_var.set("0.00")
-        self.gyro_y_filtered_var.set("0.00")
-        self.gyro_z_filtered_var.set("0.00")
-
-        self.status_var.set("Connecting...")
-        self.connection_info_label.config(text=f"Port: {self.port}, Baudrate: {self.baudrate}, Timeout: {self.timeout}")
-
-        # --- Initialize filter data structures ---
-        self.acc_x_queue = deque()
-        self.acc_y_queue = deque()
-        self.acc_z_queue = deque()
-        self.gyro_x_queue = deque()
-        self.gyro_y_queue = deque()
-        self.gyro_z_queue = deque()
+        # Bound setters of the data labels: raw then filtered, in the same order as the values returned by process_frame()
+        self._value_setters = tuple(var.set for var in self._vars.values())
+        self._value_texts = [var.get() for var in self._vars.values()]  # Text currently shown by each data label
+
+        self.set_status("Connecting...")
+        self.connection_info_label.config(text=f"Port: {self.port}, Baudrate: {self.baudrate}, Poll Interval: {self.poll_interval} ms")
 
         # --- Start Serial Connection and Data Reading ---
         self.connect_serial()
         self.start_reading()
+        self._tick()
+
+    def _make_value_label(self, text, x, y):
+        """
+        Places a data value label, preceded by its name, at the given position.
+
+        Args:
+            text (str): The name shown in front of the value (e.g. "Acc X:").
+            x (int): The x position of the name; the value is shown 50 pixels to its right.
+            y (int): The y position of the row.
+
+        Returns:
+            tk.StringVar: The variable holding the displayed value, initialized to "0.00".
+        """
+        ttk.Label(self.root, text=text).place(x=x, y=y)
+        var = tk.StringVar(value="0.00")
+        ttk.Label(self.root, textvariable=var).place(x=x + 50, y=y)
+        return var
 
     def connect_serial(self):
         """
         Establishes the serial connection.
         """
         try:
-            self.ser = serial.Serial(port=self.port, baudrate=self.baudrate, timeout=self.timeout)
-            self.status_var.set(f"Connected to {self.port}")
+            if self.ser is None:
+                # The port object is created once, unopened, and only reopened on reconnects.
+                # No flow control: the sketch never uses it, and it only adds handshake latency.
+                self.ser = serial.Serial(baudrate=self.baudrate, timeout=self.timeout,
+                                         xonxoff=False, rtscts=False, dsrdtr=False)
+                self.ser.port = self.port
+            self.ser.open()
+            try:
+                # Larger driver buffers so bursts are not chunked or dropped (only supported on Windows)
+                self.ser.set_buffer_size(rx_size=self.buffer_size, tx_size=self.buffer_size)
+            except AttributeError:
+                pass
+            self._buf = bytearray()  # Drop any partial line left over from a previous connection
+            self.set_status(f"Connected to {self.port}")
         except serial.SerialException as e:
-            self.status_var.set(f"Error: {e}")
-            self.ser = None  # Ensure self.ser is None on failure
+            self.set_status(f"Error: {e}")  # self.ser stays closed on failure
             print(f"Error connecting to serial port: {e}")
 
     def start_reading(self):
         """
-        Starts a thread to continuously read data from the serial port.
+        Starts polling the serial port for data from the Tk main loop.
         """
-        if self.ser is None:
+        if self.ser is None or not self.ser.is_open:
             print("Serial port not connected.  Cannot start reading.")
             return
 
-        self.reading_thread = threading.Thread(target=self.read_serial_data)
-        self.reading_thread.daemon = True  # Allow the program to exit even if this thread is running
-        self.reading_thread.start()
+        self.root.after(self.poll_interval, self._poll)
 
-    def read_serial_data(self):
+    def _poll(self):
         """
-        Reads data from the serial port, parses it, and updates the GUI.
-        This function runs in a separate thread.
+        Reads the data waiting on the serial port, parses it, and queues it for the GUI.
+        This function runs periodically on the Tk main loop, so it only reads what has already
+        been received and never blocks. Incomplete lines are kept until the rest arrives.
         """
         try:
-            while True:
-                data = self.ser.readline()
-                if data:
-                    data_str = data.decode('utf-8').strip()
-                    imu_data = parse_imu_data(data_str)
-                    if imu_data:
-                        acc_x, acc_y, acc_z, gyro_x, gyro_y, gyro_z = imu_data
-                        # Apply the moving average filter to each data stream
-                        acc_x_filtered = moving_average_filter(self.acc_x_queue, acc_x)
-                        acc_y_filtered = moving_average_filter(self.acc_y_queue, acc_y)
-                        acc_z_filtered = moving_average_filter(self.acc_z_queue, acc_z)
-                        gyro_x_filtered = moving_average_filter(self.gyro_x_queue, gyro_x)
-                        gyro_y_filtered = moving_average_filter(self.gyro_y_queue, gyro_y)
-                        gyro_z_filtered = moving_average_filter(self.gyro_z_queue, gyro_z)
-
-                        # Update the GUI variables.  This must be done in the main thread.
-                        self.root.after(0, self.update_gui, acc_x, acc_y, acc_z, gyro_x, gyro_y, gyro_z,
-                                         acc_x_filtered, acc_y_filtered, acc_z_filtered, gyro_x_filtered, gyro_y_filtered, gyro_z_filtered)
+            waiting = self.ser.in_waiting
+            if waiting:
+                self._buf.extend(self.ser.read(waiting))
+                lines = self._buf.split(b'\n')
+                self._buf = lines.pop()  # Incomplete line (empty if the data ended with a newline)
+
+                imu_filter = self.imu_filter  # Local lookup for the per-line loop
+                for line in lines:
+                    # Parse the line and apply the filter to all six data streams
+                    values = process_frame(line, imu_filter)
+                    if values:
+                        self._latest = values  # Shown on the next GUI tick
                     else:
-                        self.root.after(0, self.non_data_msg_var.set, data_str)
-        except serial.SerialException as e:
+                        # Only lines that are not frames get decoded, and blank ones (such as the
+                        # println() the sketch may send after each frame) are dropped before that.
+                        message = line.strip()
+                        if message:
+                            # Sketch messages are plain ASCII, which skips the UTF-8 validation pass
+                            text = message.decode('ascii') if message.isascii() else message.decode('utf-8', 'replace')
+                            self.non_data_msg_var.set(text)
+        except (serial.SerialException, OSError) as e:  # pyserial raises OSError on POSIX for some port failures
             print(f"Error reading from serial port: {e}")
-            self.root.after(0, self.status_var.set, f"Error: {e}")  # use root.after to update
-            if self.ser and self.ser.is_open:
-                self.ser.close()
-            self.root.after(0, self.connect_serial)  # attempt to reconnect
-        except Exception as e:
-            print(f"An unexpected error occurred: {e}")
-            self.root.after(0, self.status_var.set, f"Error: {e}")
-            if self.ser and self.ser.is_open:
-                self.ser.close()
-            self.root.after(0, self.connect_serial)  # attempt to reconnect
-
-    def update_gui(self, acc_x, acc_y, acc_z, gyro_x, gyro_y, gyro_z,
-                   acc_x_filtered, acc_y_filtered, acc_z_filtered, gyro_x_filtered, gyro_y_filtered, gyro_z_filtered):
+            self.restart_connection(e)
+            return
+        self.root.after(self.poll_interval, self._poll)
+
+    def restart_connection(self, error):
+        """
+        Shows the error, closes the serial port and attempts to reconnect and resume reading.
+
+        Args:
+            error (Exception): The error that interrupted reading.
+        """
+        # Show any frame received before the error now, so the next _tick() does not overwrite the error status
+        if self._latest:
+            self.update_gui(self._latest)
+            self._latest = None
+        self.set_status(f"Error: {error}")
+        if self.ser and self.ser.is_open:
+            self.ser.close()
+        self.reconnect()
+
+    def reconnect(self):
+        """
+        Attempts to reopen the serial port and resume reading, retrying periodically until it succeeds
+        (e.g. until the device is plugged back in).
+        """
+        self.connect_serial()
+        if self.ser is not None and self.ser.is_open:
+            self.start_reading()
+        else:
+            self.root.after(self.reconnect_interval, self.reconnect)
+
+    def update_gui(self, values):
         """
         Updates the GUI labels with the latest IMU data.
-        This function is called from the read_serial_data thread using root.after().
+        This function is called by _tick().
+
+        Args:
+            values (tuple): The raw values followed by the filtered values, as returned by process_frame().
+        """
+        texts = self._value_texts
+        for i, (set_value, value) in enumerate(zip(self._value_setters, values)):
+            text = format(value, '.2f')
+            if text != texts[i]:  # Readings often repeat while the IMU is still, skip redrawing those
+                set_value(text)
+                texts[i] = text
+
+        self.set_status("Receiving Data")
+
+    def set_status(self, status):
+        """
+        Updates the connection status label, only touching the StringVar when the status changes.
+
+        Args:
+            status (str): The new connection status.
+        """
+        if status != self._last_status:
+            self.status_var.set(status)
+            self._last_status = status
+
+    def _tick(self):
+        """
+        Periodically updates the GUI with the latest values received, if any.
+        Frames that arrive between two ticks are not shown, which keeps the GUI from
+        being redrawn at the serial data rate.
         """
-        # RAW Data
-        self.acc_x_var.set(f"{acc_x:.2f}")
-        self.acc_y_var.set(f"{acc_y:.2f}")
-        self.acc_z_var.set(f"{acc_z:.2f}")
-        self.gyro_x_var.set(f"{gyro_x:.2f}")
-        self.gyro_y_var.set(f"{gyro_y:.2f}")
-        self.gyro_z_var.set(f"{gyro_z:.2f}")
-
-        # Filtered Data
-        self.acc_x_filtered_var.set(f"{acc_x_filtered:.2f}")
-        self.acc_y_filtered_var.set(f"{acc_y_filtered:.2f}")
-        self.acc_z_filtered_var.set(f"{acc_z_filtered:.2f}")
-        self.gyro_x_filtered_var.set(f"{gyro_x_filtered:.2f}")
-        self.gyro_y_filtered_var.set(f"{gyro_y_filtered:.2f}")
-        self.gyro_z_filtered_var.set(f"{gyro_z_filtered:.2f}")
-
-        self.status_var.set("Receiving Data")
+        values = self._latest
+        self._latest = None
+        if values:
+            self.update_gui(values)
+        self.root.after(self.gui_update_interval, self._tick)
 
     def on_close(self):
         """